@@ -17,16 +17,22 @@ to evolve independently while still sharing a consistent data model.
 """
 
 # import dataclass to simplify object creation (auto-generates __init__, __repr__, etc.)
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 # import Enum to define fixed categories of entries
 from enum import Enum
 
 # import typing helpers for type annotations
-from typing import Dict, List
+from typing import Deque, Dict
 
-# import datetime so we can automatically timestamp log entries
-from datetime import datetime
+# import deque for bounded, ring-buffer history storage
+from collections import deque
+
+# import time for cheap log-entry timestamping
+import time
+
+# import sys for string interning of repeated field values
+import sys
 
 
 class EntryType(str, Enum):
@@ -40,69 +46,226 @@ class EntryType(str, Enum):
     Session = "Session" # Represents a daily learning session (e.g., "Studied 2 hours")
     Notes = "Notes"     # Represents reflections or freeform notes (e.g., "Got stuck debugging")
 
+    @classmethod
+    def coerce(cls, value: "EntryType | str") -> "EntryType":
+        """
+        Fast value -> member conversion.
+        Uses the precomputed _by_value table instead of Enum.__call__,
+        so hot lookups are a single dict get with no descriptor overhead.
+        """
+        return value if value.__class__ is cls else cls._by_value[value]
 
-@dataclass
+
+# precomputed value -> member table so lookups skip the Enum machinery
+EntryType._by_value = {m.value: m for m in EntryType}
+
+
+# maximum records kept per entry type; oldest entries roll off so a
+# long-running session has a fixed memory ceiling
+MAX_LOG_HISTORY = 1024
+
+
+# Specialized state factory, generated once at import time. The literal
+# dict with the four keys inlined compiles to a single BUILD_MAP, so
+# each LearnflowState() skips re-iterating the EntryType enum.
+_factory_src = "def _make_entries():\n    return {" + ", ".join(
+    f'"{e.value}": deque(maxlen=MAX_LOG_HISTORY)' for e in EntryType
+) + "}"
+exec(_factory_src, globals())
+
+
+# cache of the last formatted timestamp, keyed by its epoch second
+_last_fmt_second = -1
+_last_fmt_string = ""
+
+
+def _format_ts(ts: int) -> str:
+    """
+    Epoch seconds -> ISO-style display string (second granularity).
+    The last formatting is reused while the second matches: export and
+    history loops walk runs of records created within the same second
+    (batch imports especially), so most calls skip strftime entirely.
+    """
+    global _last_fmt_second, _last_fmt_string
+    if ts != _last_fmt_second:
+        _last_fmt_second = ts
+        _last_fmt_string = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+    return _last_fmt_string
+
+
+def coerce_ts(value) -> int:
+    """
+    Normalize a timestamp to epoch seconds.
+    Accepts the canonical int form or a legacy ISO string from older
+    saved files; anything unparsable falls back to "now".
+    """
+    if isinstance(value, int):
+        return value
+    if value:
+        try:
+            return int(time.mktime(time.strptime(value, "%Y-%m-%dT%H:%M:%S")))
+        except (ValueError, TypeError):
+            pass
+    return int(time.time())
+
+
+@dataclass(slots=True, frozen=True)
 class LearningLog:
     """
     Base log entry class for all types of learning records.
     Each log is timestamped, stores user text, and may include mood.
+    Frozen so records can be shared between the live state and
+    snapshots without risk of one side mutating the other.
     This class will later serve as the parent for derived classes
     (Week 3 requirement: GoalLog, ReflectionLog, etc.).
     """
     entry_type: EntryType   # Which type of entry this belongs to
     text: str               # The actual content the user entered
-    timestamp: str = field(
-        default_factory=lambda: datetime.now().isoformat(timespec="seconds")
-    )                       # When the entry was created, default = now
+    timestamp: int = field(
+        default_factory=lambda: int(time.time())
+    )                       # Creation time as epoch seconds (8 bytes vs ~20-char string)
     mood: str = ""          # Optional mood (primarily for Notes entries)
+    _summary: str = field(init=False, repr=False, compare=False)  # cached summary line
+
+    def __post_init__(self):
+        """
+        Precompute the summary line once. The fields are frozen, so the
+        string can never go stale, and GUI refreshes that redraw the
+        summary repeatedly become a plain attribute load.
+        Mood labels repeat across thousands of records ("motivated",
+        "stuck", ...), so intern them: every copy shares one string and
+        future equality filters reduce to a pointer compare.
+        """
+        object.__setattr__(self, "mood", sys.intern(self.mood) if self.mood else "")
+        mood_str = f" [Mood: {self.mood}]" if self.mood else ""
+        object.__setattr__(
+            self, "_summary", f"{self.entry_type.value}: {self.text}{mood_str}"
+        )
+
+    @property
+    def timestamp_str(self) -> str:
+        """
+        The creation time formatted as an ISO-style string.
+        Formatting happens only at display/export time (cached per
+        second, see _format_ts); the stored representation stays a
+        compact epoch int.
+        """
+        return _format_ts(self.timestamp)
 
     def summary(self) -> str:
         """
         Return a one-line summary for display in GUI or logs.
         Example: "Notes: Felt stuck [Mood: frustrated]"
         """
-        mood_str = f" [Mood: {self.mood}]" if self.mood else ""
-        return f"{self.entry_type.value}: {self.text}{mood_str}"
+        return self._summary
 
-@dataclass
+    def to_dict(self) -> dict:
+        """
+        This record as a plain dict (the JSON save format).
+        A single dict display built from slot loads — no getattr probes
+        or isinstance checks needed in export loops; subclasses extend
+        the dict with their own fields.
+        """
+        return {
+            "entry_type": self.entry_type.value,
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "mood": self.mood,
+        }
+
+@dataclass(slots=True, frozen=True)
 class GoalLog(LearningLog):
     """
     Derived class representing a learning goal.
     Unique attributes:
         - status: current state of the goal (planned, in-progress, done).
     Unique methods:
-        - update_status(): change status string.
+        - update_status(): derive a copy with a new status string.
     """
     status: str = "planned"  # default status when created
 
-    def update_status(self, new_status: str) -> str:
+    def update_status(self, new_status: str) -> "GoalLog":
         """
-        Update goal status and return a confirmation string.
+        Return a copy of this goal carrying the new status.
+        Records are frozen and shared between the live state and
+        snapshots, so a status change builds a fresh record instead of
+        mutating one that other views may hold; use
+        LearnflowService.update_goal_status to swap it into the state.
         """
-        self.status = new_status
-        return f"Goal '{self.text}' updated to status: {new_status}"
+        return replace(self, status=new_status)
+
+    def to_dict(self) -> dict:
+        """Base fields plus the goal's status."""
+        d = LearningLog.to_dict(self)
+        d["status"] = self.status
+        return d
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReflectionLog(LearningLog):
     """
     Derived class representing a reflective note.
     Unique attributes:
-        - mood: sentiment analysis result (inherited from base).
-    Unique methods:
-        - analyze_mood(): run sentiment analysis (TextBlob).
+        - mood: sentiment label (inherited from base), assigned at
+          creation time by the shared scorer (sentiment.mood_label).
     """
 
 @dataclass
 class LearnflowState:
     """
     The overall state of the application.
-    Stores lists of LearningLog objects for each EntryType.
+    Stores deques of LearningLog objects keyed by entry-type value string.
+    Plain str keys hash faster than Enum members, and because EntryType
+    is a str-Enum the dict can still be indexed with either form.
+    Each deque is bounded (MAX_LOG_HISTORY), so history acts as a ring
+    buffer: no reallocation on append, and memory stays capped no matter
+    how long the app runs.
     This makes it easy to:
       - Append new logs (instead of overwriting).
       - Retrieve full history later (for CSV export, history viewer).
       - Support OOP enhancements in Week 3 with derived classes.
     """
-    entries: Dict[EntryType, List[LearningLog]] = field(
-        default_factory=lambda: {e: [] for e in EntryType} # initialize dict with empty lists
+    entries: Dict[str, Deque[LearningLog]] = field(
+        default_factory=_make_entries  # generated at import, see above
     )
+
+
+@dataclass
+class LearnflowSoAState:
+    """
+    Struct-of-arrays mirror of the history, for analytics (Week 3 prep).
+    Instead of a list of LearningLog objects, each entry type holds
+    parallel columns ({"text": [...], "mood": [...], "ts": [...]}), so
+    column-wise stats (mood counts, time-window queries) touch compact
+    homogeneous arrays instead of chasing N object attributes.
+    Plain dict-of-columns rather than a numpy structured array: record
+    arrays pay a cache penalty, separate columns vectorize cleanly.
+    """
+    entries: Dict[str, dict] = field(
+        default_factory=lambda: {
+            e.value: {"text": [], "mood": [], "ts": []} for e in EntryType
+        }
+    )
+
+    def append(self, entry_type: "EntryType | str", text: str,
+               mood: str = "", ts: int = 0) -> None:
+        """
+        Append one record to the three parallel columns.
+        Timestamps are epoch seconds, the same canonical form
+        LearningLog stores.
+        """
+        key = entry_type.value if isinstance(entry_type, EntryType) else entry_type
+        cols = self.entries[key]
+        cols["text"].append(text)
+        cols["mood"].append(mood)
+        cols["ts"].append(ts or int(time.time()))
+
+    def timestamps(self, entry_type: "EntryType | str"):
+        """
+        The timestamp column as a numpy datetime64[s] array, ready for
+        vectorized time-window queries (epoch ints convert directly).
+        numpy is imported lazily so the GUI path never pays for it.
+        """
+        import numpy as np
+        key = entry_type.value if isinstance(entry_type, EntryType) else entry_type
+        return np.array(self.entries[key]["ts"], dtype="datetime64[s]")
@@ -0,0 +1,96 @@
+"""
+sentiment.py
+Author: Matt Lindborg
+Course: MS548 - Advanced Programming Concepts and AI
+Assignment: Week 2 (prep for Week 3)
+Date: 9/21/2025
+
+Purpose:
+Single home for the mood scoring shared by the GUI (ui.py) and the
+service layer (service.py), so both band text the same way.
+Scoring prefers VADER (a rule-based lexicon scorer with no POS
+tagging, well suited to short informal notes) and falls back to a
+small built-in AFINN-style lexicon when vaderSentiment is not
+installed — the app therefore has no hard NLP dependency. Either way
+the hot path is dictionary lookups plus a few float operations, and
+results are memoized per unique text.
+"""
+
+# --- Imports ---
+from functools import lru_cache   # memoize scores per unique text
+import re                         # tokenizer for the built-in lexicon
+
+
+# tokens for the built-in lexicon path: lowercase words, apostrophes kept
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+# Compact AFINN-style lexicon: word -> integer valence in [-5, 5].
+# A subset geared to the vocabulary of learning notes; plenty for the
+# three-way motivated/neutral/stuck banding when VADER is unavailable.
+_LEXICON = {
+    "abandon": -2, "ability": 2, "accomplish": 3, "accomplished": 3,
+    "achieve": 3, "achievement": 3, "amazing": 4, "angry": -3,
+    "annoyed": -2, "anxious": -2, "awesome": 4, "awful": -3,
+    "bad": -3, "best": 3, "better": 2, "blocked": -2,
+    "bored": -2, "boring": -3, "breakthrough": 3, "broken": -1,
+    "confident": 2, "confused": -2, "difficult": -1, "disappointed": -2,
+    "doubt": -1, "eager": 2, "easy": 1, "excellent": 3,
+    "excited": 3, "fail": -2, "failed": -2, "failure": -2,
+    "fantastic": 4, "frustrated": -2, "frustrating": -2, "fun": 4,
+    "glad": 3, "good": 3, "great": 3, "happy": 3,
+    "hard": -1, "hate": -3, "helpful": 2, "hopeless": -2,
+    "improve": 2, "improved": 2, "improvement": 2, "interesting": 2,
+    "lost": -3, "love": 3, "motivated": 2, "nervous": -2,
+    "nice": 3, "overwhelmed": -2, "perfect": 3, "problem": -2,
+    "problems": -2, "productive": 2, "progress": 2, "proud": 2,
+    "sad": -2, "slow": -2, "solved": 2, "stressed": -2,
+    "struggle": -2, "struggling": -2, "stuck": -2, "success": 2,
+    "successful": 3, "terrible": -3, "tired": -2, "tough": -2,
+    "useful": 2, "useless": -2, "win": 4, "wonderful": 4,
+    "worried": -3, "worse": -3, "worst": -3, "wrong": -2,
+}
+
+
+# VADER analyzer, created on first use; False once the import has
+# failed so it is never retried per call
+_analyzer = None
+
+
+@lru_cache(maxsize=1024)
+def polarity(text: str) -> float:
+    """
+    Sentiment score in [-1, 1] for a piece of text, memoized.
+    VADER's compound score when vaderSentiment is installed (imported
+    lazily on first call); otherwise the built-in lexicon: token
+    valences are summed and normalized by 4 * token count so the range
+    matches VADER's.
+    """
+    global _analyzer
+    if _analyzer is None:
+        try:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            _analyzer = SentimentIntensityAnalyzer()
+        except ImportError:
+            _analyzer = False
+    if _analyzer:
+        return _analyzer.polarity_scores(text)["compound"]
+
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return 0.0
+    return sum(_LEXICON.get(t, 0) for t in tokens) / (4.0 * len(tokens))
+
+
+# mood labels indexed by threshold band, see mood_label
+_LABELS = ("stuck", "neutral", "motivated")
+
+
+def mood_label(text: str) -> str:
+    """
+    Band a text's polarity into "motivated", "neutral", or "stuck".
+    The two threshold tests (±0.3) index straight into the label tuple,
+    so after the memoized score this is two compares and a load.
+    """
+    p = polarity(text)
+    return _LABELS[(p > 0.3) + (p >= -0.3)]
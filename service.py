@@ -20,10 +20,100 @@ expansion (OOP classes, logfile persistence, AI integration).
 
 # --- Imports ---
 from typing import Optional, Dict                          # type hinting for clarity
-from copy import deepcopy                                  # for safe state snapshot
-from domain import EntryType, LearnflowState, LearningLog  # import domain model classes
-from textblob import TextBlob                              # import for sentiment analysis
-import pyttsx3
+from collections import deque                              # rebounding history capacity
+import types                                               # read-only mapping proxy for view()
+from domain import (                                       # import domain model classes
+    EntryType,
+    LearnflowSoAState,
+    LearnflowState,
+    LearningLog,
+    GoalLog,
+    ReflectionLog,
+)
+from sentiment import mood_label                           # shared memoized mood scorer
+import atexit                                              # drain pending log lines on shutdown
+import queue                                               # thread-safe buffer for log lines
+import threading                                           # background writer thread
+
+# --- Background logfile writer ---
+# write_log() used to open/close learnflow.log synchronously per entry,
+# blocking the Tk main loop on disk I/O. Lines are now pushed onto a
+# queue and drained by a daemon thread that coalesces bursts into a
+# single write() against one long-lived file handle.
+_LOG_FILE = "learnflow.log"
+_log_queue: "queue.Queue[str]" = queue.Queue()
+
+# serializes the shared handle between the daemon writer and the
+# deterministic flush below
+_log_lock = threading.Lock()
+
+# One handle, opened once with a large buffer, shared for the process
+# lifetime. This removes the openat/close syscall pair that the old
+# per-entry `with open(...)` paid on every write.
+_log_fh = open(_LOG_FILE, "a", buffering=1 << 16, encoding="utf-8")
+
+
+def _drain_log_queue() -> None:
+    """
+    Daemon worker: block for the next line, grab anything else already
+    queued, and flush the batch with one write call. Lines are marked
+    task_done once their batch has been attempted — in a finally, so a
+    failed write (disk full, unwritable file) drops the batch but the
+    writer survives and _flush_log_queue's Queue.join() can still
+    finish instead of hanging the app on exit.
+    """
+    while True:
+        lines = [_log_queue.get()]
+        try:
+            while True:
+                lines.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            with _log_lock:
+                _log_fh.write("\n".join(lines) + "\n")
+                _log_fh.flush()
+        except Exception:
+            pass  # logging must never take the app down with it
+        finally:
+            for _ in lines:
+                _log_queue.task_done()
+
+
+def _flush_log_queue() -> None:
+    """
+    Block until every line queued so far is on disk.
+    Queue.join() covers both lines still waiting and lines the daemon
+    has popped but not yet written — they only count as done once the
+    write (and its flush) has happened — so callers can read
+    learnflow.log back immediately afterwards.
+    """
+    _log_queue.join()
+    with _log_lock:
+        try:
+            _log_fh.flush()
+        except Exception:
+            pass  # handle already unusable; nothing left to save
+
+
+_log_writer = threading.Thread(target=_drain_log_queue, daemon=True)
+_log_writer.start()
+atexit.register(_flush_log_queue)
+
+
+def _mood_suffix(r: LearningLog) -> str:
+    """Logfile suffix for records that carry a mood (or nothing)."""
+    return f" (Mood: {r.mood})" if r.mood else ""
+
+
+# Per-class logfile suffix formatters. A single type(record) dict lookup
+# replaces the isinstance chain write_log used to run per entry, and new
+# LearningLog subclasses just register a formatter here.
+_LINE_FORMATTERS = {
+    GoalLog: lambda r: f" (Status: {r.status})",
+    ReflectionLog: _mood_suffix,
+    LearningLog: _mood_suffix,
+}
 
 # --- Lightweight “assistant” logic and optional TTS ---
 class ResponseEngine:
@@ -91,6 +181,9 @@ class LearnflowService:
         self._state = state or LearnflowState()
         self.responses = ResponseEngine()  # simple rules-based replies
         self.tts = TTSService(enabled=True)  # audio on by default
+        self._version = 0  # bumped on every mutation; see version below
+        self._soa = LearnflowSoAState()  # analytics mirror, see _soa_view
+        self._soa_version = -1  # version the mirror was last built at
 
     # ------------------- COMMANDS (Mutate State) -------------------
 
@@ -108,37 +201,110 @@ class LearnflowService:
         # sanitize text (avoid storing None)
         clean_text = (text or "").strip()
 
-        # analyze sentiment polarity of the user input
-        blob = TextBlob(clean_text)
-        polarity = blob.sentiment.polarity
-
-        # classify mood based on polarity value
-        if polarity > 0.3:
-            mood = "motivated"   # positive text
-        elif polarity < -0.3:
-            mood = "stuck"       # negative text
-        else:
-            mood = "neutral"     # neutral/factual text
+        # classify mood via the shared scorer (sentiment.py): a lexicon
+        # lookup plus a few float ops, memoized per unique text
+        mood = mood_label(clean_text)
 
-        # create new log record object with mood
+        # create new log record object with mood, then store and log it
+        # through the shared mutation path below
         record = LearningLog(entry_type, clean_text, mood=mood)
+        self.append_entry(entry_type, record)
 
-        # append to the appropriate list in state
-        self._state.entries[entry_type].append(record)
+    def append_entry(self, entry_type: EntryType, log: LearningLog) -> None:
+        """
+        Append a pre-built log record and queue its logfile line.
+        The single mutation path for new records: set_entry delegates
+        here after scoring, and callers with their own records (e.g., a
+        GoalLog built by the GUI) use it directly instead of reaching
+        into _state.entries.
+        """
+        key = entry_type.value if isinstance(entry_type, EntryType) else entry_type
+        self._state.entries[key].append(log)
+        self._version += 1
+        self.write_log(log)
 
-        # placeholder hook for Week 3 logfile writing
-        self.write_log(record)
+    def restore(self, entries) -> None:
+        """
+        Replace the whole history with pre-built records (bulk load
+        path). Accepts a mapping of entry type (member or string) to an
+        iterable of records; each target deque is filled with one
+        C-level extend. Loaded records are not re-logged.
+        """
+        fresh = LearnflowState().entries
+        for key, records in entries.items():
+            k = key.value if isinstance(key, EntryType) else key
+            fresh[k].extend(records)
+        self._state.entries = fresh
+        self._version += 1
+
+    def set_entries(self, items) -> None:
+        """
+        Batch variant of set_entry: items is an iterable of
+        (entry_type, text) pairs. Lets the GUI coalesce several pending
+        additions into one service call (and one render afterwards).
+        """
+        for entry_type, text in items:
+            self.set_entry(entry_type, text)
 
     def clear(self) -> None:
         """
         Reset the entire state back to empty lists.
         Useful for starting over without restarting the program.
+        Clears the existing lists in place (C-level op, and keeps dict
+        and list identity for anything holding a reference).
         """
-        for k in self._state.entries:
-            self._state.entries[k] = []
+        for lst in self._state.entries.values():
+            lst.clear()
+        self._version += 1
+
+    def update_goal_status(self, new_status: str) -> Optional[GoalLog]:
+        """
+        Change the status of the most recent goal.
+        Records are frozen, so the goal's update_status() derives a new
+        record; this method swaps the copy into the deque (the original
+        stays intact in any snapshot that shares it) and returns it, or
+        None when no goals exist yet.
+        """
+        goals = self._state.entries[EntryType.Goal.value]
+        if not goals:
+            return None
+        latest = goals[-1]
+        if isinstance(latest, GoalLog):
+            updated = latest.update_status(new_status)
+        else:
+            # goals entered as plain LearningLog records (set_entry)
+            # are promoted to GoalLog on their first status change
+            updated = GoalLog(latest.entry_type, latest.text,
+                              timestamp=latest.timestamp,
+                              mood=latest.mood, status=new_status)
+        goals[-1] = updated
+        self._version += 1
+        return updated
+
+    def set_max_entries(self, max_entries: int) -> None:
+        """
+        Rebound the per-type history to a new capacity.
+        Each deque is rebuilt with the new maxlen, keeping its newest
+        max_entries records (deque drops from the left when shrinking),
+        so long-running sessions can dial memory up or down at runtime.
+        """
+        self._state.entries = {
+            key: deque(records, maxlen=max_entries)
+            for key, records in self._state.entries.items()
+        }
+        self._version += 1
 
     # ------------------- QUERIES (Read State) -------------------
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic mutation counter. Views can remember the value they
+        last rendered and skip all work when it hasn't moved — one int
+        compare instead of rebuilding and diffing the data itself.
+        """
+        return self._version
+
     def get_entry(self, entry_type: EntryType) -> str:
         """
         Retrieve the most recent entry for a given type.
@@ -146,8 +312,11 @@ class LearnflowService:
             - The latest entry text if available.
             - Empty string if no entries exist for this type.
         """
-        if self._state.entries[entry_type]:
-            return self._state.entries[entry_type][-1].text
+        # normalize to the plain string key once, then do a native str lookup
+        key = entry_type.value if isinstance(entry_type, EntryType) else entry_type
+
+        if self._state.entries[key]:
+            return self._state.entries[key][-1].text
         return ""
 
     def summary(self) -> Dict[str, str]:
@@ -157,53 +326,100 @@ class LearnflowService:
             { "Goal": "Finish Week 1", "Notes": "Felt motivated", ... }
         Each value comes from the LearningLog.summary() method.
         """
-        result = {}
-        for e, records in self._state.entries.items():
-            if records:  # only include if there is at least one record
-                result[e.value] = records[-1].summary()
-        return result
+        # single dict comprehension; keys are already the value strings
+        # and summary() returns the record's precomputed line
+        return {
+            key: records[-1].summary()
+            for key, records in self._state.entries.items()
+            if records
+        }
+
+    def _soa_view(self) -> LearnflowSoAState:
+        """
+        Column-wise (struct-of-arrays) mirror of the history, for the
+        analytics paths. Rebuilt lazily from the authoritative deques
+        whenever the version counter has moved, so the mutation hot
+        path never pays for mirroring and the columns cannot drift.
+        """
+        if self._soa_version != self._version:
+            soa = LearnflowSoAState()
+            for key, records in self._state.entries.items():
+                append = soa.append
+                for r in records:
+                    append(key, r.text, r.mood, r.timestamp)
+            self._soa = soa
+            self._soa_version = self._version
+        return self._soa
+
+    def stats(self, window: int = 7) -> Dict[str, object]:
+        """
+        Aggregate numeric stats over the history (Week 3 analytics prep).
+        Returns entry counts per type plus a rolling mood-score trend for
+        Notes (motivated=+1, neutral=0, stuck=-1), computed from the SoA
+        mirror's compact columns. The number crunching lives in
+        service_stats.py, imported lazily so the GUI never pays for
+        numpy/numba at startup.
+        """
+        from service_stats import mood_scores, rolling_sum
+
+        counts = {key: len(records) for key, records in self._state.entries.items()}
+        moods = self._soa_view().entries[EntryType.Notes.value]["mood"]
+        return {
+            "counts": counts,
+            "mood_trend": rolling_sum(mood_scores(moods), window),
+        }
+
+    def view(self) -> "types.MappingProxyType":
+        """
+        Zero-copy, read-only view of the live entries mapping.
+        Use this for display/inspection paths that never mutate; unlike
+        snapshot() nothing is copied, so it is free no matter how large
+        the history grows.
+        """
+        return types.MappingProxyType(self._state.entries)
 
     def snapshot(self) -> LearnflowState:
         """
-        Return a deep copy of the current LearnflowState.
-        This allows the GUI to display history safely without
-        risking accidental modification of the underlying data.
+        Return a structural copy of the current LearnflowState.
+        Only the outer dict and the per-type deques are duplicated; the
+        LearningLog records themselves are frozen (immutable), so sharing
+        them is safe and far cheaper than a full deepcopy.
         """
-        return deepcopy(self._state)
+        return LearnflowState(
+            entries={k: v.copy() for k, v in self._state.entries.items()}
+        )
 
     # ------------------- HELPER FUNCTIONS -------------------
 
     def speak_if_enabled(self, text: str) -> None:
         """Speak a line through TTS if the user has audio enabled."""
         self.tts.speak(text)
+
+    def close(self) -> None:
+        """
+        Flush any queued log lines to disk. Also registered via atexit,
+        so callers only need this when they want a deterministic flush
+        (e.g., before reading learnflow.log back).
+        """
+        _flush_log_queue()
     
     # ------------------- PLACEHOLDERS (Future Features) -------------------
 
     def write_log(self, record: "LearningLog"):
         """
-        Append a log entry to a persistent text file (learnflow.log).
+        Queue a log entry for the background writer (learnflow.log).
         Subclass-aware:
         - GoalLog → includes Status
         - ReflectionLog → includes Mood
         - LearningLog → base summary
+        The caller never blocks on disk I/O; the daemon thread batches
+        queued lines into a single write.
         """
-        from domain import GoalLog, ReflectionLog
-
-        log_file = "learnflow.log"
-
-        # Base summary always includes entry type and text
-        line = f"[{record.timestamp}] {record.entry_type.value}: {record.text}"
-
-        # Add subclass-specific info
-        if isinstance(record, GoalLog):
-            line += f" (Status: {record.status})"
-        elif isinstance(record, ReflectionLog):
-            if record.mood:
-                line += f" (Mood: {record.mood})"
-        elif record.mood:  # Base LearningLog may still carry a mood
-            line += f" (Mood: {record.mood})"
+        # Base summary always includes entry type and text, then the
+        # per-class formatter adds the subclass-specific suffix
+        suffix = _LINE_FORMATTERS.get(type(record), _mood_suffix)(record)
+        line = f"[{record.timestamp_str}] {record.entry_type.value}: {record.text}{suffix}"
 
-        # Write line to logfile
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        # Hand the line to the background writer
+        _log_queue.put_nowait(line)
 
@@ -0,0 +1,66 @@
+"""
+service_stats.py
+Author: Matt Lindborg
+Course: MS548 - Advanced Programming Concepts and AI
+Assignment: Week 2 (prep for Week 3)
+Date: 9/20/2025
+
+Purpose:
+Numeric aggregation helpers for upcoming analytics (Week 3):
+rolling sums over study minutes, mood-score trends, etc. The kernels
+operate on plain numpy arrays (see LearnflowSoAState in domain.py) so
+the math runs over contiguous memory instead of per-object attribute
+lookups. When numba is installed the kernels are JIT-compiled to native
+code; without it they fall back to the same functions interpreted, so
+numba stays an optional dependency (same pattern as TTSService).
+"""
+
+# --- Imports ---
+import numpy as np
+
+try:
+    from numba import njit  # optional JIT; falls back to pure Python below
+except Exception:
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels run uncompiled without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+# score per mood label, used to turn mood history into a numeric series
+_MOOD_SCORES = {"motivated": 1.0, "neutral": 0.0, "stuck": -1.0}
+
+
+@njit(cache=True, fastmath=True)
+def _rolling_sum(values, window):
+    """
+    Sliding-window sum over a float64 array.
+    Written as a running add/subtract so the loop is O(n) regardless of
+    window size; numba lowers it to a native loop when available.
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    acc = 0.0
+    for i in range(n):
+        acc += values[i]
+        if i >= window:
+            acc -= values[i - window]
+        out[i] = acc
+    return out
+
+
+def rolling_sum(values, window: int) -> np.ndarray:
+    """Public wrapper: coerce input to float64 and run the kernel."""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return arr
+    return _rolling_sum(arr, max(int(window), 1))
+
+
+def mood_scores(moods) -> np.ndarray:
+    """Map a sequence of mood labels to their numeric scores."""
+    return np.array([_MOOD_SCORES.get(m, 0.0) for m in moods], dtype=np.float64)
@@ -18,6 +18,7 @@ These tests are written with unittest.
 import unittest
 from domain import EntryType, LearningLog   # Domain model
 from service import LearnflowService        # Business logic
+import sentiment                            # Shared mood scorer
 
 
 class TestLearnflowService(unittest.TestCase):
@@ -77,8 +78,8 @@ class TestLearnflowService(unittest.TestCase):
         s.set_entry(EntryType.Goal, "First Goal")
         s.set_entry(EntryType.Goal, "Second Goal")
 
-        # access snapshot (a deep copy of state) for inspection
-        history = s.snapshot().entries
+        # access the zero-copy read-only view for inspection
+        history = s.view()
 
         # verify both entries are stored as LearningLog objects
         self.assertEqual(len(history[EntryType.Goal]), 2) # both entries should be stored
@@ -94,6 +95,53 @@ class TestLearnflowService(unittest.TestCase):
         self.assertTrue(summary["Goal"].startswith("Goal: Second Goal"))
 
 
+class TestSentiment(unittest.TestCase):
+    """
+    Unit tests for the shared mood scorer (sentiment.py).
+    Covers the threshold boundaries of mood_label and the built-in
+    lexicon fallback used when vaderSentiment is not installed.
+    """
+
+    def test_threshold_boundaries(self):
+        """
+        GIVEN: polarity values on and just past the +/-0.3 thresholds
+        WHEN: banded by mood_label
+        THEN: exactly +/-0.3 is still "neutral" (the comparisons are
+              strict), and values just past the edges flip the label.
+        """
+        scores = {"hi": 0.3, "lo": -0.3, "zero": 0.0,
+                  "pos": 0.31, "neg": -0.31}
+        original = sentiment.polarity
+        sentiment.polarity = scores.__getitem__  # pin known polarities
+        try:
+            self.assertEqual(sentiment.mood_label("hi"), "neutral")
+            self.assertEqual(sentiment.mood_label("lo"), "neutral")
+            self.assertEqual(sentiment.mood_label("zero"), "neutral")
+            self.assertEqual(sentiment.mood_label("pos"), "motivated")
+            self.assertEqual(sentiment.mood_label("neg"), "stuck")
+        finally:
+            sentiment.polarity = original
+
+    def test_fallback_lexicon(self):
+        """
+        GIVEN: vaderSentiment unavailable (analyzer forced off)
+        WHEN: scoring positive, negative, factual, and empty text
+        THEN: the built-in lexicon yields the same three labels and
+              empty text scores exactly 0.0.
+        """
+        original = sentiment._analyzer
+        sentiment._analyzer = False
+        sentiment.polarity.cache_clear()
+        try:
+            self.assertEqual(sentiment.mood_label("great wonderful progress"), "motivated")
+            self.assertEqual(sentiment.mood_label("frustrated and stuck"), "stuck")
+            self.assertEqual(sentiment.mood_label("studied chapter two"), "neutral")
+            self.assertEqual(sentiment.polarity(""), 0.0)
+        finally:
+            sentiment._analyzer = original
+            sentiment.polarity.cache_clear()
+
+
 # python standard entry-point for running tests
 if __name__ == "__main__":
     unittest.main()
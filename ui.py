@@ -20,13 +20,115 @@ This file does NOT contain data storage logic. Instead:
 """
 
 # --- Imports ---
+import os                                    # existence check for the logo image
 import tkinter as tk
 from tkinter import filedialog   # standard Tkinter dialogs
-import json                                  # for save/load functionality
-from textblob import TextBlob                # sentiment analysis for Notes
+from tkinter import ttk          # Treeview for the virtualized history popup
+from concurrent.futures import ThreadPoolExecutor  # file I/O off the Tk thread
+from functools import partial                # C-level bound widget commands
+from sentiment import mood_label             # shared memoized mood scorer
 from service import LearnflowService         # service layer abstraction
-from domain import EntryType, GoalLog, ReflectionLog
-import csv # excel file output
+from domain import (
+    EntryType,
+    GoalLog,
+    LearningLog,
+    ReflectionLog,
+    coerce_ts,
+)
+
+# json and csv are deliberately NOT imported here: they only run inside
+# menu callbacks, so deferring them keeps GUI cold-start fast. Mood
+# scoring lives in sentiment.py, which likewise defers its heavy import
+# (vaderSentiment) to the first scored entry.
+
+
+# the four entry types in display order, resolved once at import so GUI
+# construction and handlers never repeat the enum attribute lookups
+_ENTRY_TYPES = tuple(EntryType)
+
+# most lines kept in the AI output box; Text-widget operations slow
+# down with total content, so old conversation scrolls off the top
+# (the same ring-buffer idea as MAX_LOG_HISTORY in domain.py)
+MAX_AI_LINES = 500
+
+
+# --- Per-class serializers ---
+# Each exporter loop used to run an isinstance chain per record; these
+# tables turn the dispatch into one dict lookup on type(rec). New log
+# subclasses only need an entry here to serialize correctly. (The JSON
+# shape lives on the records themselves as LearningLog.to_dict.)
+
+# --- Per-class record factories (load path) ---
+# Inverse of the dumpers above: each takes (etype, raw_dict) and builds
+# the right log class, so load_entries can bulk-construct records.
+
+def _build_goal(etype, rec: dict) -> GoalLog:
+    """Rebuild a GoalLog from its saved dict."""
+    return GoalLog(
+        etype,
+        rec.get("text", ""),
+        timestamp=coerce_ts(rec.get("timestamp", 0)),
+        mood=rec.get("mood", ""),
+        status=rec.get("status", "planned"),
+    )
+
+
+def _build_reflection(etype, rec: dict) -> ReflectionLog:
+    """Rebuild a ReflectionLog from its saved dict."""
+    return ReflectionLog(
+        etype,
+        rec.get("text", ""),
+        timestamp=coerce_ts(rec.get("timestamp", 0)),
+        mood=rec.get("mood", ""),
+    )
+
+
+def _build_learning(etype, rec: dict) -> LearningLog:
+    """Rebuild a base LearningLog from its saved dict."""
+    return LearningLog(
+        etype,
+        rec.get("text", ""),
+        timestamp=coerce_ts(rec.get("timestamp", 0)),
+        mood=rec.get("mood", ""),
+    )
+
+
+# saved-type -> factory registry; picked once per entry-type block in
+# load_entries rather than re-branching on every record
+_LOG_BUILDERS = {
+    EntryType.Goal.value: _build_goal,
+    EntryType.Notes.value: _build_reflection,
+}
+
+
+def _csv_base(rec, et: str) -> tuple:
+    """CSV row for a plain LearningLog/ReflectionLog (empty status)."""
+    return (et, rec.timestamp_str, rec.text, rec.mood, "")
+
+
+def _csv_goal(rec, et: str) -> tuple:
+    """CSV row for a GoalLog (carries its status)."""
+    return (et, rec.timestamp_str, rec.text, rec.mood, rec.status)
+
+
+_CSV_ROWS = {GoalLog: _csv_goal, ReflectionLog: _csv_base, LearningLog: _csv_base}
+
+
+def _suffix_none(rec) -> str:
+    return ""
+
+
+def _suffix_mood(rec) -> str:
+    return f" (Mood: {rec.mood})" if rec.mood else ""
+
+
+# history popup line suffix per class
+_HISTORY_SUFFIX = {
+    GoalLog: lambda rec: f" (Status: {rec.status})",
+    ReflectionLog: _suffix_mood,
+    LearningLog: _suffix_none,
+}
+
 
 class AutoScrollbar(tk.Scrollbar):
     """
@@ -53,6 +155,18 @@ class App:
     It is initialized with a root Tkinter window and a LearnflowService.
     """
 
+    # AI entry placeholder; handlers track it with a boolean instead of
+    # re-reading and stripping the entry text on every event
+    _PLACEHOLDER = "Type your question for the AI here..."
+
+    # decoded images keyed by path, shared across App instances so each
+    # PNG is only parsed once per process however often windows reopen
+    _image_cache: dict = {}
+
+    # parsed JSON keyed by path -> (mtime, data); reopening an unchanged
+    # save file skips the re-parse, and mtime handles invalidation
+    _load_cache: dict = {}
+
     def __init__(self, root: tk.Tk, service: LearnflowService):
         """
         Constructor initializes the window, builds the layout,
@@ -67,30 +181,25 @@ class App:
         self.root.resizable(False, False)
         self.root.geometry("625x755") # hard coded to not waste space
 
-        # set base background and foreground
-        self.root.option_add("*Background", "#2b2b2b")      # dark gray background
-        self.root.option_add("*Foreground", "#ffffff")      # white text
-
-        # button colors
-        self.root.option_add("*Button.Background", "#444444")
-        self.root.option_add("*Button.Foreground", "#ffffff")
-        self.root.option_add("*Button.ActiveBackground", "#666666")
-        self.root.option_add("*Button.ActiveForeground", "#ffffff")
-
-        # entry box colors
-        self.root.option_add("*Entry.Background", "#1e1e1e")
-        self.root.option_add("*Entry.Foreground", "#dcdcdc")
-        self.root.option_add("*Entry.InsertBackground", "#ffffff")
-
-        # text box colors
-        self.root.option_add("*Text.Background", "#1e1e1e")
-        self.root.option_add("*Text.Foreground", "#dcdcdc")
-
-        # menu colors
-        self.root.option_add("*Menu.Background", "#2b2b2b")
-        self.root.option_add("*Menu.Foreground", "#ffffff")
-        self.root.option_add("*Menu.ActiveBackground", "#444444")
-        self.root.option_add("*Menu.ActiveForeground", "#ffffff")
+        # load the whole dark theme into the Tk option database with a
+        # single Tcl eval instead of ~15 individual option_add round-trips
+        self.root.tk.eval("""
+            option add *Background #2b2b2b
+            option add *Foreground #ffffff
+            option add *Button.Background #444444
+            option add *Button.Foreground #ffffff
+            option add *Button.ActiveBackground #666666
+            option add *Button.ActiveForeground #ffffff
+            option add *Entry.Background #1e1e1e
+            option add *Entry.Foreground #dcdcdc
+            option add *Entry.InsertBackground #ffffff
+            option add *Text.Background #1e1e1e
+            option add *Text.Foreground #dcdcdc
+            option add *Menu.Background #2b2b2b
+            option add *Menu.Foreground #ffffff
+            option add *Menu.ActiveBackground #444444
+            option add *Menu.ActiveForeground #ffffff
+        """)
 
         # global font setting
         default_font = ("Segoe UI", 10)
@@ -158,14 +267,16 @@ class App:
         middle_frame = tk.Frame(main_frame)
         middle_frame.grid(row=1, column=0, sticky="nsew", pady=5)
 
-        # image on the left
-        try:
-            self.image = tk.PhotoImage(file="images\\image2_50pc.png")
-            self.image_label = tk.Label(middle_frame, image=self.image)
+        # image on the left; existence is checked up front (no exception
+        # machinery on the happy path). The label is placed empty so the
+        # window can paint without waiting on the PNG decode, which runs
+        # on the idle loop right after startup — and hits the class-level
+        # cache instead when a window has been opened before.
+        self._img_path = os.path.join("images", "image2_50pc.png")
+        if os.path.exists(self._img_path):
+            self.image_label = tk.Label(middle_frame)
             self.image_label.pack(side="left", padx=(0, 10))
-        except Exception:
-            # fail gracefully if image not found
-            pass
+            self.root.after_idle(self._load_image)
 
         # right frame with stacked buttons and log box
         right_frame = tk.Frame(middle_frame)
@@ -175,14 +286,18 @@ class App:
         buttons_frame = tk.Frame(right_frame)
         buttons_frame.pack(side="left", anchor="n", padx=(0, 5))
 
-        # create one button per EntryType
-        for et in (EntryType.Goal, EntryType.Skill, EntryType.Session, EntryType.Notes):
+        # create one button per EntryType; partial instead of a lambda
+        # so each click dispatches through C code with no closure frame.
+        # grid with explicit rows instead of stacked pack calls, so the
+        # frame's geometry is solved in one pass rather than re-packing
+        # the column as each button appears
+        for row, et in enumerate(_ENTRY_TYPES):
             tk.Button(
                 buttons_frame,
                 text=et.value,
                 width=10,
-                command=lambda t=et: self.on_add_or_edit_entry(t),
-            ).pack(pady=2, anchor="w")
+                command=partial(self.on_add_or_edit_entry, et),
+            ).grid(row=row, column=0, sticky="w", pady=2)
 
         # --- Bottom row: ai input and responses output box ---
         ai_frame = tk.Frame(main_frame) # llm not integrated yet
@@ -194,7 +309,9 @@ class App:
             width=60, 
             font=default_font
             )
-        self.ai_entry.insert(0, "Type your question for the AI here...")
+        self.ai_entry.insert(0, self._PLACEHOLDER)
+        self._placeholder_active = True
+        self._key_after = None  # pending debounced <KeyRelease> callback id
 
         # remove placeholder when clicking into the box
         self.ai_entry.bind("<FocusIn>", self.clear_placeholder)
@@ -211,11 +328,13 @@ class App:
         # location in the frame
         self.ai_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
 
-        # send button (currently only echoes placeholder response)
+        # send button (currently only echoes placeholder response);
+        # bound method instead of a lambda, so clicks skip the extra
+        # Python frame the closure used to add
         self.ai_send_button = tk.Button(
             ai_frame,
             text="Send",
-            command=lambda: self.display_ai_response(self.ai_entry.get())
+            command=self.on_send
         )
         self.ai_send_button.pack(side="right")
 
@@ -262,6 +381,39 @@ class App:
         #self.root.update_idletasks()
         #self.root.minsize(self.root.winfo_width(), self.root.winfo_height())
 
+        # shared input dialog, built lazily on first use and then
+        # hidden/reshown between uses (see custom_input_popup)
+        self._input_popup = None
+
+        # memoized history snapshot, plus the formatted rows derived
+        # from it for the history popup; invalidated on entry mutation
+        self._history_cache = None
+        self._history_rows = None
+
+        # entries awaiting the idle-time batch flush (see _flush_entries)
+        self._pending_entries = []
+
+        # service version behind the last repaint; lets render_summary
+        # skip everything with one int compare when nothing changed
+        self._last_summary_version = -1
+
+        # summary lines currently in the widget, for diff-based repaints
+        self._rendered_lines = []
+
+        # True while a summary repaint is queued on the idle loop;
+        # further render_summary calls are no-ops until it runs
+        self._render_pending = False
+
+        # single worker for save/load/export file I/O so large files
+        # never freeze the Tk event loop; results are marshalled back
+        # onto the main thread with root.after
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+        # cache root geometry on every move/resize so popups can center
+        # themselves without forcing a synchronous relayout to read it
+        self._root_geom = None
+        self.root.bind("<Configure>", self._cache_root_geom)
+
         # initial render from service
         self.render_summary()
 
@@ -271,29 +423,57 @@ class App:
         """
         Custom popup dialog for text input.
         Reused by button handlers to collect user entries.
+        Widget construction is one of Tk's most expensive operations,
+        so the Toplevel is built once (lazily) and hidden/reshown with
+        withdraw/deiconify between uses; each call only updates the
+        title, prompt text, and entry contents.
         """
-        popup = tk.Toplevel(self.root)
+        if self._input_popup is None:
+            self._build_input_popup()
+
+        popup = self._input_popup
         popup.title(title)
+        self._input_prompt.set(prompt)
+        self._input_entry.delete(0, tk.END)
+        self._input_value = None
 
-        # calculate centered popup position relative to root window
+        # center and show the hidden dialog
         self.center_popup(popup, 300, 150)
+        popup.deiconify()
+        self._input_entry.focus_set()
+
+        # block like wait_window used to, but on a gate variable so the
+        # widgets survive: OK, Return, and window-close all flip it
+        popup.wait_variable(self._input_done)
+        popup.withdraw()
+        return self._input_value
+
+    def _build_input_popup(self) -> None:
+        """One-time construction of the shared input dialog."""
+        popup = tk.Toplevel(self.root)
+        popup.withdraw()
 
-        # add label and entry box
-        tk.Label(popup, text=prompt, font=("Segoe UI", 9)).pack(pady=10)
-        entry = tk.Entry(popup, width=40)
-        entry.pack(pady=5)
-        entry.focus_set()
+        self._input_prompt = tk.StringVar()
+        tk.Label(popup, textvariable=self._input_prompt, font=("Segoe UI", 9)).pack(pady=10)
+        self._input_entry = tk.Entry(popup, width=40)
+        self._input_entry.pack(pady=5)
 
-        result = {"value": None}
+        # gate variable custom_input_popup blocks on; the handlers
+        # only have to write it to release the wait
+        self._input_done = tk.BooleanVar()
+        self._input_value = None
 
         def on_ok(event=None):
-            result["value"] = entry.get()
-            popup.destroy()
+            self._input_value = self._input_entry.get()
+            self._input_done.set(True)
 
         tk.Button(popup, text="OK", command=on_ok).pack(pady=10)
         popup.bind("<Return>", on_ok)
-        self.root.wait_window(popup)
-        return result["value"]
+
+        # closing the window cancels (value stays None) instead of
+        # destroying the shared dialog
+        popup.protocol("WM_DELETE_WINDOW", lambda: self._input_done.set(True))
+        self._input_popup = popup
     
     def custom_message_popup(self, title: str, message: str, msg_type: str = "info"):
         """
@@ -350,26 +530,93 @@ class App:
         ok_button.focus_set()
         popup.bind("<Return>", lambda event=None: popup.destroy())
 
+    def _load_image(self) -> None:
+        """
+        Idle-time logo load: decode the PNG (first instance only; later
+        ones reuse the cached image) and attach it to the already-packed
+        label. Runs once, scheduled from __init__ with after_idle.
+        """
+        img = App._image_cache.get(self._img_path)
+        if img is None:
+            img = App._image_cache[self._img_path] = tk.PhotoImage(file=self._img_path)
+        self.image = img
+        self.image_label.config(image=img)
+
+    def _get_history(self):
+        """
+        Entries snapshot for the export/history features, memoized so
+        repeated menu actions (save, then export, then view) don't each
+        pay for a fresh service.snapshot(). Mutating handlers reset the
+        cache via _invalidate_history().
+        """
+        if self._history_cache is None:
+            self._history_cache = self.service.snapshot().entries
+        return self._history_cache
+
+    def _invalidate_history(self) -> None:
+        """Drop the memoized snapshot (and the rows formatted from it)
+        after any entry mutation."""
+        self._history_cache = None
+        self._history_rows = None
+
     def render_summary(self) -> None:
+        """
+        Request a summary repaint. Repaints are coalesced: however many
+        times this is called within one event cycle (batch loads,
+        clear-then-rebuild), the widget is redrawn once, at idle time.
+        """
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.root.after_idle(self._flush_render)
+
+    def _flush_render(self) -> None:
+        """Idle-time half of render_summary: do the actual repaint."""
+        self._render_pending = False
+        self._do_render_summary()
+
+    def _do_render_summary(self) -> None:
         """
         Render the latest entries (summary) in the bottom output box.
         """
-        summary = self.service.summary()
+        # no-op when the service hasn't mutated since the last repaint:
+        # a single int compare, before even the summary dict is built
+        version = self.service.version
+        if version == self._last_summary_version:
+            return
+        self._last_summary_version = version
+
+        new = list(self.service.summary().values())
+
+        # diff against what the widget already shows and replace only
+        # the changed suffix. In the common case (one entry added or
+        # updated) the shared prefix lines stay untouched and the Tcl
+        # work is one delete plus one insert near the bottom, instead
+        # of rewriting the whole buffer.
+        old = self._rendered_lines
+        k = 0
+        for a, b in zip(old, new):
+            if a != b:
+                break
+            k += 1
 
-        # update summary box
         self.summary_box.config(state="normal")
-        self.summary_box.delete("1.0", tk.END)
-        for val in summary.values():
-            self.summary_box.insert(tk.END, f"{val}\n")
+        self.summary_box.delete(f"{k + 1}.0", tk.END)
+        if k < len(new):
+            self.summary_box.insert(tk.END, "\n".join(new[k:]) + "\n")
         self.summary_box.config(state="disabled")
+        self._rendered_lines = new
 
     def clear_placeholder(self, event):
         """
         Remove placeholder text when user clicks into the entry box.
+        Flips the boolean so later handlers never have to read and
+        compare the entry text again.
         """
-        if self.ai_entry.get().strip() == "Type your question for the AI here...":
+        if self._placeholder_active:
             self.ai_entry.delete(0, tk.END)
             self.ai_entry.unbind("<FocusIn>")
+            self._placeholder_active = False
 
     '''def restore_placeholder(self, event):
         """
@@ -385,18 +632,24 @@ class App:
         - Append placeholder AI response
         - Keep placeholder behavior intact
         """
+        # ignore if placeholder still showing
+        if self._placeholder_active:
+            return
+
         user_input = self.ai_entry.get().strip()
 
-        # ignore if placeholder or empty
-        if not user_input or user_input == "Type your question for the AI here...":
+        # ignore if empty
+        if not user_input:
             return
 
-        # insert into output box (below existing placeholder message)
+        # insert into output box (below existing placeholder message);
+        # user line and placeholder response go in as one string, so the
+        # widget is crossed into once instead of twice per submission
         self.ai_output_box.config(state="normal")
-        self.ai_output_box.insert(tk.END, f"You: {user_input}\n")
-
-        # insert a fake AI response placeholder
-        self.ai_output_box.insert(tk.END, "AI: (placeholder response)\n\n")
+        self.ai_output_box.insert(
+            tk.END, f"You: {user_input}\nAI: (placeholder response)\n\n"
+        )
+        self._trim_ai_output()
 
         # scroll to bottom and lock text box again
         self.ai_output_box.see(tk.END)
@@ -410,12 +663,24 @@ class App:
         self.ai_entry.focus_set()
 
     def focus_send_button(self, event):
+        """
+        Debounced <KeyRelease> handler: each keystroke cancels any
+        pending check and re-schedules it 50 ms out, so however fast
+        the user types, the real logic runs at most ~20 times a second.
+        """
+        if self._key_after is not None:
+            self.root.after_cancel(self._key_after)
+        self._key_after = self.root.after(50, self._apply_entry_focus)
+
+    def _apply_entry_focus(self):
         """
         If the user has started typing real text,
         keep focus in the entry box until Enter is pressed.
+        The boolean check avoids allocating a stripped copy of the
+        entry text on every keystroke.
         """
-        current_text = self.ai_entry.get().strip()
-        if current_text and current_text != "Type your question for the AI here...":
+        self._key_after = None
+        if not self._placeholder_active:
             # Keep focus in the entry so user can continue typing
             self.ai_entry.focus_set()
 
@@ -434,9 +699,23 @@ class App:
         if not text:
             return  # user canceled
 
-        # sentiment for all entries
-        self.service.set_entry(entry_type, text)
+        # queue the addition; an idle callback flushes all pending
+        # entries through the service in one batch, so rapid submissions
+        # within a single event cycle cost one flush + one re-render
+        if not self._pending_entries:
+            self.root.after_idle(self._flush_entries)
+        self._pending_entries.append((entry_type, text))
 
+    def _flush_entries(self) -> None:
+        """
+        Idle-time flush: push every queued (entry_type, text) pair
+        through the service as one batch, then refresh the summary once.
+        """
+        pending, self._pending_entries = self._pending_entries, []
+        if not pending:
+            return
+        self.service.set_entries(pending)
+        self._invalidate_history()
         self.render_summary()
 
     def clear_entries(self) -> None:
@@ -444,9 +723,24 @@ class App:
         Clear all entries from the service and refresh display.
         """
         self.service.clear()
+        self._invalidate_history()
         self.render_summary()
         self.custom_message_popup("Cleared", "All entries have been cleared.", msg_type="info")
 
+    def _trim_ai_output(self) -> None:
+        """
+        Drop lines past MAX_AI_LINES from the top of the AI output box.
+        Called with the widget already in state="normal"; a single
+        delete per trim keeps the conversation buffer bounded.
+        """
+        lines = int(self.ai_output_box.index("end-1c").split(".")[0])
+        if lines > MAX_AI_LINES:
+            self.ai_output_box.delete("1.0", f"{lines - MAX_AI_LINES}.0")
+
+    def on_send(self) -> None:
+        """Send-button handler: echo whatever is in the AI entry box."""
+        self.display_ai_response(self.ai_entry.get())
+
     def display_ai_response(self, user_input: str):
         """
         Display ai responses to user
@@ -454,8 +748,11 @@ class App:
         if not user_input.strip():
             return
         self.ai_output_box.config(state="normal")
-        self.ai_output_box.insert(tk.END, f"You: {user_input}\n")
-        self.ai_output_box.insert(tk.END, "AI: (placeholder response)\n\n")
+        # both lines in a single insert (one Tcl call, one re-layout)
+        self.ai_output_box.insert(
+            tk.END, f"You: {user_input}\nAI: (placeholder response)\n\n"
+        )
+        self._trim_ai_output()
         self.ai_output_box.config(state="disabled")
         self.ai_output_box.see(tk.END)
         self.ai_entry.delete(0, tk.END)
@@ -479,12 +776,13 @@ class App:
         
         self.root.config(menu=menubar)
 
-        # add Entries menu with entry-related actions
+        # add Entries menu with entry-related actions (partial, not
+        # lambda: static argument, C-callable dispatch)
         entries_menu = tk.Menu(menubar, tearoff=0)
-        entries_menu.add_command(label="Goal", command=lambda: self.on_add_or_edit_entry(EntryType.Goal))
-        entries_menu.add_command(label="Skill", command=lambda: self.on_add_or_edit_entry(EntryType.Skill))
-        entries_menu.add_command(label="Session", command=lambda: self.on_add_or_edit_entry(EntryType.Session))
-        entries_menu.add_command(label="Notes", command=lambda: self.on_add_or_edit_entry(EntryType.Notes))
+        entries_menu.add_command(label="Goal", command=partial(self.on_add_or_edit_entry, EntryType.Goal))
+        entries_menu.add_command(label="Skill", command=partial(self.on_add_or_edit_entry, EntryType.Skill))
+        entries_menu.add_command(label="Session", command=partial(self.on_add_or_edit_entry, EntryType.Session))
+        entries_menu.add_command(label="Notes", command=partial(self.on_add_or_edit_entry, EntryType.Notes))
         entries_menu.add_separator()
         entries_menu.add_command(label="Clear", command=self.clear_entries)
         menubar.add_cascade(label="Entries", menu=entries_menu)
@@ -496,6 +794,8 @@ class App:
         - LearningLog → entry_type, text, timestamp, mood
         - GoalLog → adds 'status'
         - ReflectionLog → keeps 'mood'
+        Uses orjson (C serializer, writes bytes directly) when it is
+        installed, otherwise falls back to the stdlib json module.
         """
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json", filetypes=[("JSON files", "*.json")]
@@ -503,36 +803,56 @@ class App:
         if not file_path:
             return
 
-        history = self.service.snapshot().entries
-
-        from domain import GoalLog, ReflectionLog
-
-        export_dict = {}
-
-        for et, logs in history.items():
-            if logs:
-                export_dict[et.value] = []
-                for rec in logs:
-                    # Base record dictionary
-                    record_dict = {
-                        "entry_type": et.value,
-                        "text": rec.text,
-                        "timestamp": rec.timestamp,
-                        "mood": getattr(rec, "mood", "")
-                    }
+        history = self._get_history()
 
-                    # Add subclass-specific attributes
-                    if isinstance(rec, GoalLog):
-                        record_dict["status"] = rec.status
-                    elif isinstance(rec, ReflectionLog):
-                        record_dict["mood"] = rec.mood  # Ensure mood is present
-
-                    export_dict[et.value].append(record_dict)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(export_dict, f, indent=4)
+        # the snapshot goes to the worker as-is: per-record dicts are
+        # built there, one entry type at a time, so no full export dict
+        # (a second copy of the whole history) is ever materialized
+        future = self._io_pool.submit(self._write_json, file_path, history)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._notify_io_done, f,
+                                      "Saved", f"Entries saved to {file_path}")
+        )
 
-        self.custom_message_popup("Saved", f"Entries saved to {file_path}", msg_type="info")
+    @staticmethod
+    def _write_json(file_path: str, history) -> None:
+        """
+        Worker-thread half of save_entries: encode and write the file.
+        The object is streamed one entry type at a time — each type's
+        record dicts are built (rec.to_dict), encoded with orjson when
+        available (stdlib json otherwise), written, and discarded before
+        the next type starts. Peak memory is one type's records instead
+        of the whole export, at the cost of compact (unindented) output.
+        """
+        try:
+            from orjson import dumps
+        except ImportError:
+            import json
+
+            def dumps(obj):
+                return json.dumps(obj).encode("utf-8")
+
+        with open(file_path, "wb") as f:
+            f.write(b"{")
+            first = True
+            for et, logs in history.items():
+                if not logs:
+                    continue
+                if not first:
+                    f.write(b",")
+                first = False
+                f.write(dumps(et) + b": " + dumps([rec.to_dict() for rec in logs]))
+            f.write(b"}")
+
+    def _notify_io_done(self, future, title: str, message: str) -> None:
+        """
+        Main-thread completion hook for background file operations:
+        report the error if the worker raised, else the success popup.
+        """
+        if future.exception() is not None:
+            self.custom_message_popup("Error", f"{title} failed!", msg_type="error")
+        else:
+            self.custom_message_popup(title, message, msg_type="info")
 
     def load_entries(self):
         """
@@ -546,38 +866,65 @@ class App:
         if not file_path:
             return
 
-        from domain import GoalLog, ReflectionLog, LearningLog, EntryType
+        # read + parse in the worker; rebuild state on the Tk thread
+        future = self._io_pool.submit(self._read_json, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_loaded, f, file_path)
+        )
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    @classmethod
+    def _read_json(cls, file_path: str) -> dict:
+        """
+        Worker-thread half of load_entries: read and parse the file.
+        An unchanged file (same path, same mtime) is served from the
+        parse cache; otherwise it mirrors _write_json, preferring
+        orjson's C parser and falling back to stdlib json.
+        """
+        mtime = os.path.getmtime(file_path)
+        hit = cls._load_cache.get(file_path)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
 
-            # Reset current state before loading
-            self.service._state.entries = {e: [] for e in EntryType}
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        try:
+            import orjson
+            data = orjson.loads(raw)
+        except ImportError:
+            import json
+            data = json.loads(raw)
+        cls._load_cache[file_path] = (mtime, data)
+        return data
+
+    def _apply_loaded(self, future, file_path: str) -> None:
+        """
+        Main-thread half of load_entries: rebuild the state from the
+        parsed data (Tk widgets and service state are only touched here).
+        """
+        if future.exception() is not None:
+            self.custom_message_popup("Error", "Failed to load file!", msg_type="error")
+            return
 
+        try:
+            data = future.result()
+
+            # bulk-construct each type's records; the factory is picked
+            # once per type from the registry (GoalLog for goals,
+            # ReflectionLog for notes, base log otherwise), so the
+            # inner comprehension is branch-free. The whole mapping is
+            # handed to the service in one restore() call.
+            restored = {}
             for etype_str, records in data.items():
-                etype = EntryType(etype_str)
-                for rec in records:
-                    text = rec.get("text", "")
-                    timestamp = rec.get("timestamp", "")
-                    mood = rec.get("mood", "")
-
-                    if "status" in rec:
-                        # Build GoalLog
-                        entry = GoalLog(etype, text, timestamp=timestamp, mood=mood, status=rec["status"])
-                    elif etype == EntryType.Notes:
-                        # Build ReflectionLog
-                        entry = ReflectionLog(etype, text, timestamp=timestamp, mood=mood)
-                    else:
-                        # Build base LearningLog
-                        entry = LearningLog(etype, text, timestamp=timestamp, mood=mood)
-
-                    self.service._state.entries[etype].append(entry)
+                etype = EntryType.coerce(etype_str)
+                build = _LOG_BUILDERS.get(etype_str, _build_learning)
+                restored[etype] = [build(etype, rec) for rec in records]
+            self.service.restore(restored)
 
+            self._invalidate_history()
             self.render_summary()
             self.custom_message_popup("Loaded", f"Entries loaded from {file_path}", msg_type="info")
 
-        except Exception as e:
+        except Exception:
             self.custom_message_popup("Error", "Failed to load file!", msg_type="error")
 
     def show_history(self):
@@ -587,52 +934,81 @@ class App:
             - GoalLog → shows status
             - ReflectionLog → shows mood
         """
-        history = self.service.snapshot().entries
+        # the formatted rows are cached alongside the snapshot, so
+        # reopening the popup without intervening mutations skips the
+        # per-record timestamp formatting and suffix dispatch entirely
+        if self._history_rows is None:
+            self._history_rows = [
+                (etype, [
+                    (str(idx), rec.timestamp_str, rec.text,
+                     _HISTORY_SUFFIX.get(type(rec), _suffix_mood)(rec).strip())
+                    for idx, rec in enumerate(records, 1)
+                ])
+                for etype, records in self._get_history().items()
+                if records
+            ]
 
         popup = tk.Toplevel(self.root)
         popup.title("History Log")
         self.center_popup(popup, 600, 400)
 
-        scrollbar = tk.Scrollbar(popup)
-        scrollbar.pack(side="right", fill="y")
-
-        text_area = tk.Text(popup, wrap="word", yscrollcommand=scrollbar.set)
-        text_area.pack(fill="both", expand=True)
-        scrollbar.config(command=text_area.yview)
-
-        for etype, records in history.items():
-            if records:
-                text_area.insert(tk.END, f"{etype.value}:\n")
-                for idx, rec in enumerate(records, 1):
-                    line = f"  {idx}. [{rec.timestamp}] {rec.text}"
-
-                    # If record is a GoalLog, add status
-                    from domain import GoalLog, ReflectionLog
-                    if isinstance(rec, GoalLog):
-                        line += f" (Status: {rec.status})"
-
-                    # If record is a ReflectionLog, add mood
-                    elif isinstance(rec, ReflectionLog):
-                        if rec.mood:
-                            line += f" (Mood: {rec.mood})"
+        # Treeview instead of a Text widget: Tk's Text re-runs layout
+        # work for its entire contents, so it bogs down past a few
+        # thousand lines. The tree only draws the rows scrolled into
+        # view, keeping the popup fast however large the history grows.
+        style = ttk.Style(popup)
+        style.configure(
+            "Treeview",
+            background="#1e1e1e", fieldbackground="#1e1e1e", foreground="#dcdcdc",
+        )
 
-                    text_area.insert(tk.END, line + "\n")
+        tree = ttk.Treeview(popup, columns=("timestamp", "text", "details"))
+        tree.heading("#0", text="Entry")
+        tree.heading("timestamp", text="Timestamp")
+        tree.heading("text", text="Text")
+        tree.heading("details", text="Details")
+        tree.column("#0", width=80, stretch=False)
+        tree.column("timestamp", width=150, stretch=False)
+        tree.column("text", width=250)
+        tree.column("details", width=110)
+
+        scrollbar = tk.Scrollbar(popup, command=tree.yview)
+        tree.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(fill="both", expand=True)
 
-                text_area.insert(tk.END, "\n")
+        # one expanded parent node per entry type, one child row per
+        # record, all straight out of the precomputed row cache
+        for etype, rows in self._history_rows:
+            parent = tree.insert("", "end", text=etype, open=True)
+            for label, ts, text, details in rows:
+                tree.insert(parent, "end", text=label, values=(ts, text, details))
 
-        text_area.config(state="disabled")
+    def _cache_root_geom(self, event=None):
+        """
+        Record the root window's position and size.
+        Bound to <Configure>, so the cache follows every move/resize and
+        center_popup never has to run update_idletasks just to read it.
+        """
+        self._root_geom = (
+            self.root.winfo_x(),
+            self.root.winfo_y(),
+            self.root.winfo_width(),
+            self.root.winfo_height(),
+        )
 
     def center_popup(self, popup, width, height):
         """
         Center any popup relative to the main app window.
+        Uses the cached geometry; only the very first call (before any
+        <Configure> event) pays for an update_idletasks.
         """
-        self.root.update_idletasks()
+        if self._root_geom is None:
+            self.root.update_idletasks()
+            self._cache_root_geom()
 
         # grab the info for the root frame
-        main_x = self.root.winfo_x()
-        main_y = self.root.winfo_y()
-        main_w = self.root.winfo_width()
-        main_h = self.root.winfo_height()
+        main_x, main_y, main_w, main_h = self._root_geom
 
         # calculate horizontal offset: start from the root x position,
         # then add half the root width, and subtract half the popup width
@@ -658,52 +1034,47 @@ class App:
         if not file_path:
             return
 
-        history = self.service.snapshot().entries
+        history = self._get_history()
+
+        # snapshot in hand, the writing happens in the worker thread
+        future = self._io_pool.submit(self._write_csv, file_path, history)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._notify_io_done, f,
+                                      "Exported", f"Entries exported to {file_path}")
+        )
 
-        from domain import GoalLog, ReflectionLog
+    @staticmethod
+    def _write_csv(file_path: str, history) -> None:
+        """Worker-thread half of export_csv: format and write the rows."""
+        import csv
 
-        with open(file_path, "w", newline="", encoding="utf-8") as f:
+        # 1 MiB buffer: rows accumulate in memory and reach the OS in a
+        # handful of large write() syscalls instead of many small ones
+        with open(file_path, "w", newline="", encoding="utf-8",
+                  buffering=1024 * 1024) as f:
             writer = csv.writer(f)
 
             # Write header row
             writer.writerow(["EntryType", "Timestamp", "Text", "Mood", "Status"])
 
-            # Write one row per log entry
-            for etype, records in history.items():
-                for rec in records:
-                    mood = rec.mood if hasattr(rec, "mood") else ""
-                    status = ""
-
-                    # Handle derived class specifics
-                    if isinstance(rec, GoalLog):
-                        status = rec.status
-                    elif isinstance(rec, ReflectionLog):
-                        mood = rec.mood  # ReflectionLog should always carry mood
-
-                    writer.writerow([
-                        etype.value,
-                        rec.timestamp,
-                        rec.text,
-                        mood,
-                        status
-                    ])
-        self.custom_message_popup("Exported", f"Entries exported to {file_path}", msg_type="info")
+            # One row per log entry; the per-class row builder supplies
+            # mood/status without isinstance checks, and writerows feeds
+            # the whole stream through the C csv module in one call
+            writer.writerows(
+                _CSV_ROWS.get(type(rec), _csv_base)(rec, etype)
+                for etype, records in history.items()
+                for rec in records
+            )
 
 
     # ------------------- UTILITIES -------------------
 
     def analyze_mood(self, text: str) -> str:
         """
-        Run sentiment analysis on note text using TextBlob.
+        Run sentiment analysis on note text.
         Returns one of: "motivated", "stuck", or "neutral".
-        Polarity amounts chosen for simplicity.
-        """
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        if polarity > 0.3:      # positive sentiment
-            return "motivated"
-        elif polarity < -0.3:   # negative sentiment
-            return "stuck"
-        else:                   # neutral sentiment
-            return "neutral"
+        Delegates to the shared memoized scorer in sentiment.py so the
+        GUI and service layer always band text identically.
+        """
+        return mood_label(text)
             